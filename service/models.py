@@ -175,6 +175,12 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of Products")
+        return db.session.query(db.func.count(cls.id)).scalar()
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
@@ -187,7 +193,8 @@ class Product(db.Model):
 
         """
         logger.info("Processing lookup for id %s ...", product_id)
-        return cls.query.get(product_id)
+        # Query.get() is deprecated in SQLAlchemy 2.0; Session.get() replaces it
+        return db.session.get(cls, product_id)
 
     @classmethod
     def find_by_name(cls, name: str) -> list:
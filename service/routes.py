@@ -122,7 +122,7 @@ def list_products():
     else:
         products = Product.all()
     data = [product.serialize() for product in products]
-    app.logger.info(f"Returning {len(data)} products")
+    app.logger.info("Returning %s products", len(data))
     return data, status.HTTP_200_OK
 
 ######################################################################
@@ -137,11 +137,11 @@ def list_products():
 @app.route('/products/<product_id>', methods=['GET'])
 def get_products(product_id):
     """This endpoint reads a product and returns it as JSON"""
-    app.logger.info(f"Request to retrieve product with id: {product_id}")
+    app.logger.info("Request to retrieve product with id: %s", product_id)
     product = Product.find(product_id)
     if product is None:
         abort(status.HTTP_404_NOT_FOUND, f"Product with id: {product_id} was not found.")
-    app.logger.info(f"Returning product: {product.name}")
+    app.logger.info("Returning product: %s", product.name)
     return product.serialize(), status.HTTP_200_OK
 
 ######################################################################
@@ -156,7 +156,7 @@ def get_products(product_id):
 @app.route('/products/<product_id>', methods=['PUT'])
 def update_products(product_id):
     """This endpoint updates a product and returns it as JSON"""
-    app.logger.info(f"Request to update product with id: {product_id}")
+    app.logger.info("Request to update product with id: %s", product_id)
     data = request.get_json()
     product = Product.find(product_id)
     if product is None:
@@ -176,7 +176,7 @@ def update_products(product_id):
 @app.route('/products/<product_id>', methods=['DELETE'])
 def delete_products(product_id):
     """This endpoint deletes a product"""
-    app.logger.info(f"Request to delete product with id: {product_id}")
+    app.logger.info("Request to delete product with id: %s", product_id)
     product = Product.find(product_id)
     if product is None:
         abort(status.HTTP_404_NOT_FOUND, f"Product with id: {product_id} was not found.")
@@ -82,8 +82,7 @@ class TestProductRoutes(TestCase):
     def _create_products(self, count: int = 1) -> list:
         """Factory method to create products in bulk"""
         products = []
-        for _ in range(count):
-            test_product = ProductFactory()
+        for test_product in ProductFactory.build_batch(count):
             response = self.client.post(BASE_URL, json=test_product.serialize())
             self.assertEqual(
                 response.status_code, status.HTTP_201_CREATED, "Could not create test product"